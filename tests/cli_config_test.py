@@ -1,5 +1,6 @@
 """Unit tests for CLI configuration management."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -7,7 +8,7 @@ import pytest
 
 # Skip entire module if CLI dependencies not available
 try:
-    from wekan.cli.config import WekanConfig, load_config
+    from wekan.cli.config import WekanConfig, load_config, save_config
 except ImportError:
     pytest.skip("CLI dependencies not installed", allow_module_level=True)
 
@@ -91,3 +92,45 @@ class TestLoadConfig:
         assert config.username == "envuser"
         assert config.password == "envpass"
         assert config.timeout == 75000
+
+
+class TestConfigFileCache:
+    """Test the mtime-keyed config file cache behind load_config."""
+
+    def test_second_load_returns_cached_values(self, tmp_path):
+        """Test that an unchanged file is served from the cache."""
+        config_file = tmp_path / ".wekan"
+        config_file.write_text("WEKAN_USERNAME=cacheduser\n")
+        assert load_config(config_file).username == "cacheduser"
+
+        # Rewrite the file but restore its mtime; the cache considers the
+        # file unchanged and keeps serving the first parse.
+        stat = config_file.stat()
+        config_file.write_text("WEKAN_USERNAME=otheruser\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert load_config(config_file).username == "cacheduser"
+
+    def test_reload_after_mtime_change(self, tmp_path):
+        """Test that a changed mtime invalidates the cached parse."""
+        config_file = tmp_path / ".wekan"
+        config_file.write_text("WEKAN_USERNAME=firstuser\n")
+        assert load_config(config_file).username == "firstuser"
+
+        stat = config_file.stat()
+        config_file.write_text("WEKAN_USERNAME=seconduser\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert load_config(config_file).username == "seconduser"
+
+    def test_save_config_invalidates_cache(self, tmp_path):
+        """Test that save_config drops the cache entry for the file."""
+        config_file = tmp_path / ".wekan"
+        save_config(WekanConfig(username="saveduser"), config_file)
+        assert load_config(config_file).username == "saveduser"
+
+        # Pin the mtime across the rewrite to simulate a save landing within
+        # the same mtime tick; the explicit cache drop in save_config must
+        # still make the next load see the new values.
+        stat = config_file.stat()
+        save_config(WekanConfig(username="newuser"), config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert load_config(config_file).username == "newuser"
@@ -1,17 +1,6 @@
 """Python client library for WeKan REST API."""
 
-from wekan.board import Board
-from wekan.card import WekanCard
-from wekan.card_checklist import CardChecklist
-from wekan.card_checklist_item import CardChecklistItem
-from wekan.card_comment import CardComment
-from wekan.customfield import Customfield
-from wekan.integration import Integration
-from wekan.label import Label
-from wekan.swimlane import Swimlane
-from wekan.user import WekanUser
-from wekan.wekan_client import WekanClient
-from wekan.wekan_list import WekanList
+import importlib
 
 __all__ = [
     "Board",
@@ -29,3 +18,30 @@ __all__ = [
 ]
 
 __version__ = "0.3.1"
+
+# Submodules are imported lazily (PEP 562) so that e.g. the CLI can start
+# without paying for requests/urllib3 until a network class is touched.
+_module_by_export = {
+    "Board": "wekan.board",
+    "WekanCard": "wekan.card",
+    "CardChecklist": "wekan.card_checklist",
+    "CardChecklistItem": "wekan.card_checklist_item",
+    "CardComment": "wekan.card_comment",
+    "Customfield": "wekan.customfield",
+    "Integration": "wekan.integration",
+    "Label": "wekan.label",
+    "Swimlane": "wekan.swimlane",
+    "WekanUser": "wekan.user",
+    "WekanClient": "wekan.wekan_client",
+    "WekanList": "wekan.wekan_list",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = importlib.import_module(_module_by_export[name])
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ if typing.TYPE_CHECKING:
     from wekan.wekan_client import WekanClient
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from wekan.base import WekanBase
 from wekan.customfield import Customfield
@@ -94,10 +95,11 @@ class Board(WekanBase):
         :return Instances of class Board
         :rtype list
         """
-        instances = []
-        for board in data:
-            instances.append(cls(client=client, board_id=board["_id"]))
-        return instances
+        if len(data) <= 1:
+            return [cls(client=client, board_id=board["_id"]) for board in data]
+        # Each instantiation is one blocking API call; fetch them concurrently.
+        with ThreadPoolExecutor(max_workers=min(8, len(data))) as executor:
+            return list(executor.map(lambda board: cls(client=client, board_id=board["_id"]), data))
 
     def list_custom_fields(self, regex_filter=".*") -> list[Customfield]:
         """
@@ -105,10 +107,11 @@ class Board(WekanBase):
         :param regex_filter: Regex filter that will be applied to the search.
         :return: Instances of class Customfield
         """
+        pattern = re.compile(regex_filter)
         all_custom_fields = Customfield.from_list(
             parent_board=self, data=self.__get_all_custom_fields()
         )
-        return [field for field in all_custom_fields if re.search(regex_filter, field.name)]
+        return [field for field in all_custom_fields if pattern.search(field.name)]
 
     def get_labels(self, regex_filter=".*") -> list[Label]:
         """
@@ -116,8 +119,9 @@ class Board(WekanBase):
         :param regex_filter: Regex filter that will be applied to the search.
         :return: list of labels
         """
+        pattern = re.compile(regex_filter)
         all_labels = Label.from_list(parent_board=self, data=self.__raw_data.get("labels", []))
-        return [label for label in all_labels if re.search(regex_filter, label.name)]
+        return [label for label in all_labels if pattern.search(label.name)]
 
     def get_lists(self, regex_filter=".*") -> list[WekanList]:
         """
@@ -125,8 +129,9 @@ class Board(WekanBase):
         :param regex_filter: Regex filter that will be applied to the search.
         :return: list of lists
         """
+        pattern = re.compile(regex_filter)
         all_lists = WekanList.from_list(parent_board=self, data=self.__get_all_lists())
-        return [w_list for w_list in all_lists if re.search(regex_filter, w_list.title)]
+        return [w_list for w_list in all_lists if pattern.search(w_list.title)]
 
     def list_swimlanes(self, regex_filter=".*") -> list[Swimlane]:
         """
@@ -134,8 +139,9 @@ class Board(WekanBase):
         :param regex_filter: Regex filter that will be applied to the search.
         :return: list of swimlanes
         """
+        pattern = re.compile(regex_filter)
         all_swimlanes = Swimlane.from_list(parent_board=self, data=self.__get_all_swimlanes())
-        return [swimlane for swimlane in all_swimlanes if re.search(regex_filter, swimlane.title)]
+        return [swimlane for swimlane in all_swimlanes if pattern.search(swimlane.title)]
 
     def list_integrations(self, regex_filter=".*") -> list[Integration]:
         """
@@ -143,13 +149,12 @@ class Board(WekanBase):
         :param regex_filter: Regex filter that will be applied to the search.
         :return: list of integrations
         """
+        pattern = re.compile(regex_filter)
         all_integrations = Integration.from_list(
             parent_board=self, data=self.__get_all_integrations()
         )
         return [
-            integration
-            for integration in all_integrations
-            if re.search(regex_filter, integration.title)
+            integration for integration in all_integrations if pattern.search(integration.title)
         ]
 
     def get_swimlane_by_id(self, swimlane_id: str) -> Swimlane:
@@ -6,6 +6,7 @@ if typing.TYPE_CHECKING:
     from wekan.wekan_list import WekanList
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 
 from wekan.base import WekanBase
@@ -19,8 +20,9 @@ class WekanCard(WekanBase):
         self.list = parent_list
         self.id = card_id
 
+        client = self.list.board.client
         uri = f"/api/boards/{self.list.board.id}/lists/{self.list.id}/cards/{self.id}"
-        data = self.list.board.client.fetch_json(uri)
+        data = client.fetch_json(uri)
         self.title = data["title"]
         self.members = data["members"]
         self.label_ids = data["labelIds"]
@@ -30,9 +32,9 @@ class WekanCard(WekanBase):
         self.card_number = data["cardNumber"]
         self.archived = data["archived"]
         self.parent_id = data["parentId"]
-        self.created_at = self.list.board.client.parse_iso_date(data["createdAt"])
-        self.modified_at = self.list.board.client.parse_iso_date(data["modifiedAt"])
-        self.date_last_activity = self.list.board.client.parse_iso_date(data["dateLastActivity"])
+        self.created_at = client.parse_iso_date(data["createdAt"])
+        self.modified_at = client.parse_iso_date(data["modifiedAt"])
+        self.date_last_activity = client.parse_iso_date(data["dateLastActivity"])
         self.description = data["description"]
         self.requested_by = data["requestedBy"]
         self.assigned_by = data["assignedBy"]
@@ -42,37 +44,14 @@ class WekanCard(WekanBase):
         self.subtask_sort = data["subtaskSort"]
         self.linked_id = data["linkedId"]
         # Following things are not always defined if card was created on a very old version of WeKan
-        try:
-            self.cover_id = data["coverId"]
-        except KeyError:
-            self.cover_id = None
-        try:
-            self.vote = data["vote"]
-        except KeyError:
-            self.vote = None
-        try:
-            self.poker = data["poker"]
-        except KeyError:
-            self.poker = None
-        try:
-            self.target_id_gantt = data["targetId_gantt"]
-        except KeyError:
-            self.target_id_gantt = None
-        try:
-            self.link_type_gantt = data["linkType_gantt"]
-        except KeyError:
-            self.link_type_gantt = None
-        try:
-            self.link_id_gantt = data["linkId_gantt"]
-        except KeyError:
-            self.link_id_gantt = None
-        try:
-            if data["dueAt"]:
-                self.due_at = self.list.board.client.parse_iso_date(data["dueAt"])
-            else:
-                self.due_at = None
-        except KeyError:
-            self.due_at = None
+        self.cover_id = data.get("coverId")
+        self.vote = data.get("vote")
+        self.poker = data.get("poker")
+        self.target_id_gantt = data.get("targetId_gantt")
+        self.link_type_gantt = data.get("linkType_gantt")
+        self.link_id_gantt = data.get("linkId_gantt")
+        due_at = data.get("dueAt")
+        self.due_at = client.parse_iso_date(due_at) if due_at else None
 
     def __repr__(self) -> str:
         return f"<WekanCard (id: {self.id}, title: {self.title})>"
@@ -122,10 +101,13 @@ class WekanCard(WekanBase):
         :param data: Response of Card GET.
         :return: Instances of class WekanCard
         """
-        instances = []
-        for card in data:
-            instances.append(cls(parent_list=parent_list, card_id=card["_id"]))
-        return instances
+        if len(data) <= 1:
+            return [cls(parent_list=parent_list, card_id=card["_id"]) for card in data]
+        # Each instantiation is one blocking API call; fetch them concurrently.
+        with ThreadPoolExecutor(max_workers=min(8, len(data))) as executor:
+            return list(
+                executor.map(lambda card: cls(parent_list=parent_list, card_id=card["_id"]), data)
+            )
 
     def __get_all_checklists(self) -> list:
         """
@@ -143,10 +125,9 @@ class WekanCard(WekanBase):
         :param regex_filter: Regex filter that will be applied to the search.
         :return: list of checklists
         """
+        pattern = re.compile(regex_filter)
         all_checklists = CardChecklist.from_list(parent_card=self, data=self.__get_all_checklists())
-        return [
-            checklist for checklist in all_checklists if re.search(regex_filter, checklist.title)
-        ]
+        return [checklist for checklist in all_checklists if pattern.search(checklist.title)]
 
     def __get_all_comments(self) -> list:
         """
@@ -281,5 +262,8 @@ class WekanCard(WekanBase):
         if new_swimlane:
             payload["swimlaneId"] = new_swimlane.id
 
+        if not payload:
+            return
+
         uri = f"/api/boards/{self.list.board.id}/lists/{self.list.id}/cards/{self.id}"
         self.list.board.client.fetch_json(uri, payload=payload, http_method="PUT")
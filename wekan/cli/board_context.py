@@ -3,6 +3,7 @@ Interactive board context for WeKan CLI.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from rich.columns import Columns
@@ -17,7 +18,7 @@ except ImportError:
 from wekan.wekan_client import WekanClient
 
 from .commands.boards import find_board
-from .config import load_config
+from .config import load_config, missing_credentials
 
 
 class BoardContext:
@@ -54,18 +55,22 @@ class BoardContext:
                 )
                 return
 
-            # Create KANBAN visualization
-            columns_data = []
-
-            for i, lst in enumerate(lists, 1):
-                # Get cards for this list
-                cards = []
+            # Fetch cards for every list concurrently - each get_cards call
+            # is a blocking API round trip per card underneath.
+            def fetch_cards(lst) -> list:
                 try:
-                    cards = lst.get_cards() if hasattr(lst, "get_cards") else []
+                    return lst.get_cards() if hasattr(lst, "get_cards") else []
                 except Exception:  # nosec B110
                     # Ignore errors when fetching cards for display
-                    pass
+                    return []
+
+            with ThreadPoolExecutor(max_workers=min(8, len(lists))) as executor:
+                cards_per_list = list(executor.map(fetch_cards, lists))
 
+            # Create KANBAN visualization
+            columns_data = []
+
+            for i, (lst, cards) in enumerate(zip(lists, cards_per_list), 1):
                 # Create list column
 
                 # Create cards table
@@ -217,15 +222,9 @@ class BoardContext:
             lists = self.board.get_lists() if hasattr(self.board, "get_lists") else []
             swimlanes = self.board.list_swimlanes() if hasattr(self.board, "list_swimlanes") else []
 
-            # Count total cards
-            total_cards = 0
-            for lst in lists:
-                try:
-                    cards = lst.get_cards() if hasattr(lst, "get_cards") else []
-                    total_cards += len(cards)
-                except Exception:  # nosec B110
-                    # Ignore errors when counting cards
-                    pass
+            # Count total cards from the per-list counters - counting via
+            # get_cards() would fetch every single card.
+            total_cards = sum(getattr(lst, "cards_count", 0) or 0 for lst in lists)
 
             info_content = [
                 f" ID: {self.board.id}",
@@ -264,11 +263,8 @@ class BoardContext:
             table.add_column("Cards", style="green", justify="right")
 
             for i, lst in enumerate(lists, 1):
-                try:
-                    cards = lst.get_cards() if hasattr(lst, "get_cards") else []
-                    card_count = str(len(cards))
-                except Exception:
-                    card_count = "?"
+                count = getattr(lst, "cards_count", None)
+                card_count = str(count) if count is not None else "?"
 
                 table.add_row(str(i), lst.id[:8] + "...", lst.title, card_count)
 
@@ -390,7 +386,7 @@ def activate_board(identifier: str) -> None:
     """
     config = load_config()
 
-    if not config.base_url or not config.username or not config.password:
+    if missing_credentials(config):
         print(" Not configured. Run 'wekan config init' to set up.")
         return
 
@@ -14,9 +14,7 @@ except ImportError:
     print("CLI dependencies not installed. Install with: pip install python-wekan[cli]")
     sys.exit(1)
 
-from wekan.wekan_client import WekanClient
-
-from ..config import load_config
+from ..config import load_config, missing_credentials
 
 app = typer.Typer(help="Authentication commands")
 console = Console()
@@ -26,11 +24,14 @@ console = Console()
 def auth_main(ctx: typer.Context) -> None:
     """Authentication commands. Run 'wekan auth --help' for available commands."""
     if ctx.invoked_subcommand is None:
-        console.print("  Authentication commands available:")
-        console.print("  • [bold]wekan auth login[/bold] - Login to WeKan server")
-        console.print("  • [bold]wekan auth whoami[/bold] - Show current user")
-        console.print("  • [bold]wekan auth logout[/bold] - Logout information")
-        console.print("\n Use 'wekan auth --help' for detailed help")
+        # Static block; one print renders it in a single pass.
+        console.print(
+            "  Authentication commands available:\n"
+            "  • [bold]wekan auth login[/bold] - Login to WeKan server\n"
+            "  • [bold]wekan auth whoami[/bold] - Show current user\n"
+            "  • [bold]wekan auth logout[/bold] - Logout information\n"
+            "\n Use 'wekan auth --help' for detailed help"
+        )
 
 
 @app.command()
@@ -40,6 +41,8 @@ def login(
     server: Optional[str] = typer.Option(None, "--server", "-s", help="WeKan server URL"),
 ) -> None:
     """Login to WeKan server."""
+    from wekan.wekan_client import WekanClient
+
     config = load_config()
 
     # Use provided values or fall back to config
@@ -94,17 +97,15 @@ def login(
 @app.command()
 def whoami() -> None:
     """Show current user information."""
+    from wekan.wekan_client import WekanClient
+
     config = load_config()
 
-    if not config.base_url or not config.username:
+    if missing_credentials(config):
         console.print(" Not logged in. Run 'wekan auth login' first.")
         raise typer.Exit(1)
 
     try:
-        if not config.base_url or not config.username or not config.password:
-            console.print(" Not logged in. Run 'wekan auth login' first.")
-            raise typer.Exit(1)
-
         WekanClient(
             base_url=str(config.base_url),
             username=str(config.username),
@@ -127,8 +128,10 @@ def whoami() -> None:
 @app.command()
 def logout() -> None:
     """Logout from WeKan (clears stored credentials)."""
-    console.print("  WeKan CLI uses configuration files for authentication.")
-    console.print("To 'logout', remove or modify your .wekan configuration file.")
-    console.print(" Configuration locations:")
-    console.print("   • Current directory: ./.wekan")
-    console.print("   • Home directory: ~/.wekan")
+    console.print(
+        "  WeKan CLI uses configuration files for authentication.\n"
+        "To 'logout', remove or modify your .wekan configuration file.\n"
+        " Configuration locations:\n"
+        "   • Current directory: ./.wekan\n"
+        "   • Home directory: ~/.wekan"
+    )
@@ -3,6 +3,7 @@ Board management commands for WeKan CLI.
 """
 
 import sys
+import typing
 from typing import Optional
 
 try:
@@ -14,10 +15,11 @@ except ImportError:
     print("CLI dependencies not installed. Install with: pip install python-wekan[cli]")
     sys.exit(1)
 
-from wekan.board import Board
-from wekan.wekan_client import WekanClient
+if typing.TYPE_CHECKING:
+    from wekan.board import Board
+    from wekan.wekan_client import WekanClient
 
-from ..config import load_config
+from ..config import load_config, missing_credentials
 
 app = typer.Typer(help="Board management commands")
 console = Console()
@@ -27,21 +29,26 @@ console = Console()
 def boards_main(ctx: typer.Context) -> None:
     """Board management commands. Run 'wekan boards --help' for available commands."""
     if ctx.invoked_subcommand is None:
-        console.print("  Board management commands available:")
-        console.print("  • [bold]wekan boards list[/bold] - List all boards")
-        console.print("  • [bold]wekan boards show <id>[/bold] - Show board details")
+        # Static block; one print renders it in a single pass.
         console.print(
-            "  • [bold]wekan boards activate <id>[/bold] - Enter interactive board context"
+            "  Board management commands available:\n"
+            "  • [bold]wekan boards list[/bold] - List all boards\n"
+            "  • [bold]wekan boards show <id>[/bold] - Show board details\n"
+            "  • [bold]wekan boards activate <id>[/bold] - Enter interactive board context\n"
+            "  • [bold]wekan boards create <title>[/bold] - Create new board\n"
+            "\n Use 'wekan boards --help' for detailed help"
         )
-        console.print("  • [bold]wekan boards create <title>[/bold] - Create new board")
-        console.print("\n Use 'wekan boards --help' for detailed help")
 
 
-def get_client() -> WekanClient:
+def get_client() -> "WekanClient":
     """Get authenticated WeKan client."""
+    # Imported lazily so commands that never touch the network don't pay
+    # for loading requests/urllib3.
+    from wekan.wekan_client import WekanClient
+
     config = load_config()
 
-    if not config.base_url or not config.username or not config.password:
+    if missing_credentials(config):
         console.print(" Not configured. Run 'wekan config init' to set up.")
         raise typer.Exit(1)
 
@@ -54,10 +61,27 @@ def get_client() -> WekanClient:
         raise typer.Exit(1)
 
 
-def find_board(client: WekanClient, identifier: str) -> Optional[Board]:
-    """Find board by ID prefix, name, or local index."""
+def find_board(
+    client: "WekanClient", identifier: str, boards: "list[Board] | None" = None
+) -> "Board | None":
+    """Find board by ID prefix, name, or local index.
+
+    Pass boards to resolve against an already-fetched listing instead of
+    hitting the API again.
+    """
+    from wekan.wekan_client import WekanAPIError
+
+    # Full WeKan ids are 17 characters; resolve those with a single board
+    # fetch instead of listing every board first.
+    if len(identifier) == 17 and boards is None:
+        try:
+            return client.get_board(identifier)
+        except WekanAPIError:
+            pass  # Not a board id after all; fall back to the listing scan
+
     try:
-        boards = client.list_boards()
+        if boards is None:
+            boards = client.list_boards()
 
         if not boards:
             console.print(" No boards found.")
@@ -69,8 +93,18 @@ def find_board(client: WekanClient, identifier: str) -> Optional[Board]:
             if 0 <= index < len(boards):
                 return boards[index]
 
-        # Try to match by ID prefix
-        id_matches = [b for b in boards if b and hasattr(b, "id") and b.id.startswith(identifier)]
+        # Partition ID-prefix and name matches in a single pass; name matches
+        # are only consulted when no board matches the ID prefix, so the
+        # elif loses nothing.
+        id_matches = []
+        name_matches = []
+        lowered = identifier.lower()
+        for b in boards:
+            if b and hasattr(b, "id") and b.id.startswith(identifier):
+                id_matches.append(b)
+            elif b and hasattr(b, "title") and lowered in b.title.lower():
+                name_matches.append(b)
+
         if len(id_matches) == 1:
             return id_matches[0]
         elif len(id_matches) > 1:
@@ -80,10 +114,7 @@ def find_board(client: WekanClient, identifier: str) -> Optional[Board]:
                     console.print(f"  {i}. {board.id[:12]}... - {board.title}")
             return None
 
-        # Try to match by name (case-insensitive)
-        name_matches = [
-            b for b in boards if b and hasattr(b, "title") and identifier.lower() in b.title.lower()
-        ]
+        # Fall back to the name matches (case-insensitive)
         if len(name_matches) == 1:
             return name_matches[0]
         elif len(name_matches) > 1:
@@ -190,11 +221,9 @@ def show(identifier: str) -> None:
             list_table.add_column("Title", style="magenta")
 
             for i, lst in enumerate(lists, 1):
-                try:
-                    cards = lst.get_cards() if hasattr(lst, "get_cards") else []
-                    card_count = len(cards)
-                except Exception:
-                    card_count = "?"
+                # cards_count comes from the list itself - counting via
+                # get_cards() would fetch every single card.
+                card_count = getattr(lst, "cards_count", "?")
 
                 list_table.add_row(str(i), lst.id[:8] + "...", f"{lst.title} ({card_count} cards)")
 
@@ -34,6 +34,16 @@ class WekanConfig(BaseModel):
         return v
 
 
+def missing_credentials(config: WekanConfig) -> list:
+    """Return the names of required connection fields that are not set."""
+    required = (
+        ("base_url", config.base_url),
+        ("username", config.username),
+        ("password", config.password),
+    )
+    return [name for name, value in required if not value]
+
+
 def find_config_file() -> Optional[Path]:
     """Find WeKan configuration file."""
     # Check current directory
@@ -49,29 +59,53 @@ def find_config_file() -> Optional[Path]:
     return None
 
 
+# Parsed config files keyed by path; entries are invalidated via mtime so
+# repeated load_config calls within one process skip the re-read and re-parse.
+_file_config_cache: dict = {}
+
+
+def _read_config_file(config_file: Path) -> dict:
+    """Parse a config file, reusing the cached result while it is unchanged."""
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except OSError:
+        return {}
+    cached = _file_config_cache.get(config_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    file_config = {}
+    with open(config_file) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, value = line.split("=", 1)
+                key = key.strip().replace("WEKAN_", "").lower()
+                value = value.strip().strip("\"'")
+                file_config[key] = value
+
+    _file_config_cache[config_file] = (mtime_ns, file_config)
+    return file_config
+
+
 def load_config(config_file: Optional[Path] = None) -> WekanConfig:
     """Load WeKan configuration."""
     if config_file is None:
         config_file = find_config_file()
 
-    # Load from environment variables first
+    # Load from environment variables first (never cached - they may change
+    # between calls)
     env_config = {}
     for key in ["BASE_URL", "USERNAME", "PASSWORD", "TOKEN", "TIMEOUT"]:
         env_key = f"WEKAN_{key}"
         if env_key in os.environ:
             env_config[key.lower()] = os.environ[env_key]
 
-    # Load from config file if it exists
+    # Load from config file if it exists (missing files read as empty - the
+    # stat inside _read_config_file doubles as the existence check)
     file_config = {}
-    if config_file and config_file.exists():
-        with open(config_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip().replace("WEKAN_", "").lower()
-                    value = value.strip().strip("\"'")
-                    file_config[key] = value
+    if config_file:
+        file_config = _read_config_file(config_file)
 
     # Environment variables take precedence over file config
     config_data = {**file_config, **env_config}
@@ -84,12 +118,18 @@ def save_config(config: WekanConfig, config_file: Optional[Path] = None) -> None
     if config_file is None:
         config_file = Path(".wekan")
 
+    lines = [f"WEKAN_BASE_URL={config.base_url}\n"]
+    if config.username:
+        lines.append(f"WEKAN_USERNAME={config.username}\n")
+    if config.password:
+        lines.append(f"WEKAN_PASSWORD={config.password}\n")
+    if config.token:
+        lines.append(f"WEKAN_TOKEN={config.token}\n")
+    lines.append(f"WEKAN_TIMEOUT={config.timeout}\n")
+
     with open(config_file, "w") as f:
-        f.write(f"WEKAN_BASE_URL={config.base_url}\n")
-        if config.username:
-            f.write(f"WEKAN_USERNAME={config.username}\n")
-        if config.password:
-            f.write(f"WEKAN_PASSWORD={config.password}\n")
-        if config.token:
-            f.write(f"WEKAN_TOKEN={config.token}\n")
-        f.write(f"WEKAN_TIMEOUT={config.timeout}\n")
+        f.write("".join(lines))
+
+    # Drop any cached parse of this file so the next load_config sees the
+    # new values even within the same mtime tick.
+    _file_config_cache.pop(config_file, None)
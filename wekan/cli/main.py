@@ -11,10 +11,8 @@ except ImportError as e:
         "CLI dependencies not installed. Install with: pip install python-wekan[cli]"
     ) from e
 
-from wekan.wekan_client import WekanClient
-
 from .commands import auth, boards, config
-from .config import load_config
+from .config import load_config, missing_credentials
 
 app = typer.Typer(
     name="wekan",
@@ -35,41 +33,43 @@ app.add_typer(config.app, name="config", help="Configuration management commands
 def main_callback(ctx: typer.Context) -> None:
     """Wekan CLI - Command line interface for Wekan kanban boards."""
     if ctx.invoked_subcommand is None:
-        console.print()
-        console.print(
-            "[bold blue]WeKan CLI[/bold blue] - Command line interface for WeKan kanban boards"
-        )
-        console.print()
-        console.print("[bold]Common commands:[/bold]")
-        console.print("  • [bold cyan]wekan status[/bold cyan] - Show connection status")
-        console.print(
-            "  • [bold cyan]wekan navigate[/bold cyan] - Start navigation shell (recommended!)"
-        )
-        console.print("  • [bold cyan]wekan config init[/bold cyan] - Initialize configuration")
-        console.print("  • [bold cyan]wekan boards list[/bold cyan] - List all boards")
-        console.print()
-        console.print("[bold]Available command groups:[/bold]")
-        console.print("  • [bold green]auth[/bold green]    - Authentication commands")
-        console.print("  • [bold green]boards[/bold green]  - Board management commands")
-        console.print("  • [bold green]config[/bold green]  - Configuration management commands")
-        console.print()
+        # Emit the whole overview with a single render instead of one
+        # console.print per line.
         console.print(
+            "\n"
+            "[bold blue]WeKan CLI[/bold blue] - Command line interface for WeKan kanban boards\n"
+            "\n"
+            "[bold]Common commands:[/bold]\n"
+            "  • [bold cyan]wekan status[/bold cyan] - Show connection status\n"
+            "  • [bold cyan]wekan navigate[/bold cyan] - Start navigation shell (recommended!)\n"
+            "  • [bold cyan]wekan config init[/bold cyan] - Initialize configuration\n"
+            "  • [bold cyan]wekan boards list[/bold cyan] - List all boards\n"
+            "\n"
+            "[bold]Available command groups:[/bold]\n"
+            "  • [bold green]auth[/bold green]    - Authentication commands\n"
+            "  • [bold green]boards[/bold green]  - Board management commands\n"
+            "  • [bold green]config[/bold green]  - Configuration management commands\n"
+            "\n"
             "Use [bold]wekan --help[/bold] for detailed help or ",
-            "[bold]wekan <command> --help[/bold] for command-specific help",
+            "[bold]wekan <command> --help[/bold] for command-specific help\n",
         )
-        console.print()
 
 
 @app.command()  # type: ignore[misc]
 def status() -> None:
     """Show WeKan connection status."""
+    # Imported lazily so commands that never touch the network don't pay
+    # for loading requests/urllib3.
+    from wekan.wekan_client import WekanClient
+
     try:
         config = load_config()
-        if not config.base_url:
+        missing = missing_credentials(config)
+        if "base_url" in missing:
             console.print("No WeKan server configured. Run 'wekan config init' to set up.")
             raise typer.Exit(1)
 
-        if not config.username or not config.password:
+        if missing:
             console.print("No credentials configured. Run 'wekan config init' to set up.")
             raise typer.Exit(1)
 
@@ -11,18 +11,21 @@ from typing import Optional
 try:
     from rich.console import Console
     from rich.panel import Panel
+    from rich.prompt import Confirm
     from rich.table import Table
 except ImportError:
     print("CLI dependencies not installed. Install with: pip install python-wekan[cli]")
     sys.exit(1)
 
+from dateutil import parser as date_parser
+
 from wekan.board import Board
 from wekan.card import WekanCard
 from wekan.wekan_client import WekanClient
 from wekan.wekan_list import WekanList
 
 from .commands.boards import find_board
-from .config import load_config
+from .config import load_config, missing_credentials
 
 
 class ContextLevel(Enum):
@@ -47,6 +50,10 @@ class NavigationContext:
         self.list_obj: Optional[WekanList] = None
         self.card: Optional[WekanCard] = None
 
+        # Boards fetched by the last root-level ls; reused by cd so entering
+        # a board doesn't trigger a second listing fetch.
+        self._boards_cache: Optional[list[Board]] = None
+
         # Navigation history
         self.history: list[str] = []
         self.setup_readline()
@@ -149,7 +156,7 @@ class NavigationContext:
 
     def activate_board(self, identifier: str) -> bool:
         """Activate/navigate to a board."""
-        board = find_board(self.client, identifier)
+        board = find_board(self.client, identifier, boards=self._boards_cache)
         if not board:
             return False
 
@@ -315,6 +322,7 @@ class NavigationContext:
         """List available boards."""
         try:
             boards = self.client.list_boards()
+            self._boards_cache = boards
 
             if not boards:
                 self.console.print("[yellow]No boards found.[/yellow]")
@@ -366,11 +374,10 @@ class NavigationContext:
             table.add_column("Cards", style="green", justify="right")
 
             for i, lst in enumerate(lists, 1):
-                try:
-                    cards = lst.get_cards()
-                    card_count = str(len(cards))
-                except Exception:
-                    card_count = "?"
+                # cards_count comes from the list itself - counting via
+                # get_cards() would fetch every single card.
+                count = getattr(lst, "cards_count", None)
+                card_count = str(count) if count is not None else "?"
 
                 table.add_row(str(i), lst.id[:8] + "..." if lst.id else "", lst.title, card_count)
 
@@ -693,8 +700,6 @@ class NavigationContext:
                 self.console.print("[yellow]Card is already in this list[/yellow]")
                 return
 
-            from rich.prompt import Confirm
-
             if Confirm.ask(f"Move '{self.card.title}' to '{target_list.title}'?"):
                 try:
                     # Move the card using the WeKan API
@@ -724,8 +729,6 @@ class NavigationContext:
 
     def delete_current_card(self) -> None:
         """Delete current card."""
-        from rich.prompt import Confirm
-
         if self.card and Confirm.ask(
             f"[red]Delete card '{self.card.title}'? This cannot be undone![/red]"
         ):
@@ -794,19 +797,23 @@ class NavigationContext:
 
     def show_card_edit_menu(self) -> None:
         """Show the card editing menu."""
-        self.console.print("╭─────────────────────────────────────────────────────────────╮")
-        self.console.print("│                       Card Editor Menu                       │")
-        self.console.print("├─────────────────────────────────────────────────────────────┤")
-        self.console.print("│ 1. Basic Info (Title)                                      │")
-        self.console.print("│ 2. Dates & Times (Start, Due, End, Received)               │")
-        self.console.print("│ 3. Members & Roles (Assign, Request, Creator)              │")
-        self.console.print("│ 4. Labels & Tags                                           │")
-        self.console.print("│ 5. Description                                             │")
-        self.console.print("│ 6. Card Color                                              │")
-        self.console.print("│ 7. Advanced (Comments, Subtasks, Custom Fields)           │")
-        self.console.print("├─────────────────────────────────────────────────────────────┤")
-        self.console.print("│ Type 'done' when finished editing                          │")
-        self.console.print("╰─────────────────────────────────────────────────────────────╯")
+        # The menu is static text; render it with one print instead of
+        # one call (and one write) per line.
+        self.console.print(
+            "╭─────────────────────────────────────────────────────────────╮\n"
+            "│                       Card Editor Menu                       │\n"
+            "├─────────────────────────────────────────────────────────────┤\n"
+            "│ 1. Basic Info (Title)                                      │\n"
+            "│ 2. Dates & Times (Start, Due, End, Received)               │\n"
+            "│ 3. Members & Roles (Assign, Request, Creator)              │\n"
+            "│ 4. Labels & Tags                                           │\n"
+            "│ 5. Description                                             │\n"
+            "│ 6. Card Color                                              │\n"
+            "│ 7. Advanced (Comments, Subtasks, Custom Fields)           │\n"
+            "├─────────────────────────────────────────────────────────────┤\n"
+            "│ Type 'done' when finished editing                          │\n"
+            "╰─────────────────────────────────────────────────────────────╯"
+        )
 
     def edit_card_basic(self) -> None:
         """Edit basic card information."""
@@ -862,10 +869,7 @@ class NavigationContext:
 
             if new_date_str:
                 try:
-                    # Parse the date
-                    from dateutil import parser
-
-                    new_date = parser.parse(new_date_str)
+                    new_date = date_parser.parse(new_date_str)
                     changes[field] = new_date.isoformat() if new_date else None
                     self.console.print(f"[green]✓ {label} will be set to: {new_date}[/green]")
                 except Exception as e:
@@ -1158,7 +1162,7 @@ def start_navigation() -> None:
     """Start the WeKan navigation shell."""
     config = load_config()
 
-    if not config.base_url or not config.username or not config.password:
+    if missing_credentials(config):
         print("Not configured. Run 'wekan config init' to set up.")
         return
 
@@ -33,6 +33,15 @@ class WekanClient:
         self.base_url = base_url
         self.username = username
         self.password = password
+        # Reuse one pooled session so consecutive (and concurrent) requests
+        # share keep-alive connections instead of re-doing the TCP/TLS setup.
+        # pool_maxsize covers the worst-case nested fan-out (8 list-fetch
+        # threads each driving an 8-worker from_list pool); an undersized
+        # pool would discard and re-open connections under that load.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=64)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self.__renew_login_data()
 
     def __renew_login_data(self):
@@ -60,10 +69,27 @@ class WekanClient:
         List all (matching) boards
         :return: list of boards
         """
-        public_boards = Board.from_list(self, data=self.__get_public_boards())
-        private_boards = Board.from_list(self, data=self.__get_boards())
-        all_boards = public_boards + private_boards
-        return [board for board in all_boards if re.search(regex_filter, board.title)]
+        # Filter on the raw API response in a single pass before creating
+        # Board instances, since each instantiation triggers an API call.
+        # Boards can appear in both the public and the user listing.
+        pattern = re.compile(regex_filter)
+        matching_boards = []
+        seen_ids = set()
+        for board in self.__get_public_boards() + self.__get_boards():
+            if board["_id"] in seen_ids:
+                continue
+            seen_ids.add(board["_id"])
+            if pattern.search(board.get("title", "")):
+                matching_boards.append(board)
+        return Board.from_list(self, data=matching_boards)
+
+    def get_board(self, board_id: str) -> Board:
+        """
+        Get a single Board by id according to https://wekan.github.io/api/v7.42/#get_board
+        :param board_id: id of the board to fetch data from
+        :return: Instance of class Board
+        """
+        return Board(client=self, board_id=board_id)
 
     def __get_all_users(self) -> list:
         """
@@ -79,8 +105,9 @@ class WekanClient:
         Get all (matching) users
         :return: list of users
         """
+        pattern = re.compile(regex_filter)
         all_users = WekanUser.from_list(client=self, data=self.__get_all_users())
-        return [user for user in all_users if re.search(regex_filter, user.username)]
+        return [user for user in all_users if pattern.search(user.username)]
 
     def get_current_user(self) -> WekanUser:
         """Get current user details."""
@@ -91,12 +118,20 @@ class WekanClient:
         if not username and not email:
             raise ValueError("Either username or email must be provided.")
 
-        users = self.get_users()
-        for user in users:
-            if username and user.username == username:
-                return user
-            if email and email in [e["address"] for e in user.emails]:
-                return user
+        users_data = self.__get_all_users()
+        if username:
+            # Usernames are part of the raw listing, so a match can be found
+            # without instantiating a WekanUser (one API call) per candidate.
+            for user in users_data:
+                if user.get("username") == username:
+                    return WekanUser.from_dict(client=self, data=user)
+        if email:
+            # E-Mail addresses are not part of the listing; fetch users one by
+            # one and stop at the first match.
+            for user in users_data:
+                user_obj = WekanUser.from_dict(client=self, data=user)
+                if email in [e["address"] for e in user_obj.emails]:
+                    return user_obj
         return None
 
     def __get_api_token(self):
@@ -126,7 +161,7 @@ class WekanClient:
         :return: status
         :rtype: bool
         """
-        now = datetime.now().replace(tzinfo=timezone.utc)
+        now = datetime.now(timezone.utc)
         expire_date = self.parse_iso_date(self.token_expire_date)
         return expire_date < now
 
@@ -150,8 +185,11 @@ class WekanClient:
             # pass if the variable self.token_expire_date isn't defined
             pass
 
-        response = requests.request(
-            method=http_method, url=url, headers=headers, data=json.dumps(payload)
+        response = self._session.request(
+            method=http_method,
+            url=url,
+            headers=headers,
+            data=json.dumps(payload, separators=(",", ":")),
         )
         try:
             response.raise_for_status()
@@ -7,6 +7,7 @@ if typing.TYPE_CHECKING:
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 from wekan.base import WekanBase
 from wekan.card import WekanCard
@@ -63,8 +64,9 @@ class WekanList(WekanBase):
         :param regex_filter: Regex filter that will be applied to the search.
         :return: list of cards
         """
+        pattern = re.compile(regex_filter)
         all_cards = WekanCard.from_list(parent_list=self, data=self.__get_all_cards_on_list())
-        return [card for card in all_cards if re.search(regex_filter, card.title)]
+        return [card for card in all_cards if pattern.search(card.title)]
 
     def get_card_by_id(self, card_id: str) -> WekanCard:
         """
@@ -95,10 +97,18 @@ class WekanList(WekanBase):
         :param data: Response of List creation.
         :return: Instances of class WekanList
         """
-        instances = []
-        for wekan_list in data:
-            instances.append(cls(parent_board=parent_board, list_id=wekan_list["_id"]))
-        return instances
+        if len(data) <= 1:
+            return [
+                cls(parent_board=parent_board, list_id=wekan_list["_id"]) for wekan_list in data
+            ]
+        # Each instantiation is one blocking API call; fetch them concurrently.
+        with ThreadPoolExecutor(max_workers=min(8, len(data))) as executor:
+            return list(
+                executor.map(
+                    lambda wekan_list: cls(parent_board=parent_board, list_id=wekan_list["_id"]),
+                    data,
+                )
+            )
 
     def update(self, title: str = None, position: int = None) -> WekanList:
         """Update list properties."""